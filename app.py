@@ -18,6 +18,7 @@ import sys
 import streamlit.components.v1 as components
 
 # Try to import PyMuPDF first, fallback to pypdfium2 for Streamlit Cloud compatibility
+# (vrai import : un paquet présent mais non chargeable doit basculer sur le fallback)
 PDF_LIBRARY = None
 try:
     import fitz
@@ -11,29 +11,74 @@ Fonctionnalités essentielles :
 4. Filtrage simple mais efficace (logos, headers, doublons)
 """
 
+from __future__ import annotations
+
+import importlib.util
 import logging
+import re
 import time
+from bisect import bisect_left
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import hashlib
 
 # Try PyMuPDF first, fallback to pypdfium2 for cloud compatibility
+# (détection sans import : la bibliothèque n'est chargée qu'à la première extraction)
 PDF_BACKEND = None
-try:
-    import fitz
+if importlib.util.find_spec("fitz") is not None:
     PDF_BACKEND = "pymupdf"
-except ImportError:
-    try:
-        import pypdfium2 as pdfium
-        PDF_BACKEND = "pypdfium2"
-    except ImportError:
-        raise ImportError("Aucune bibliothèque PDF disponible. Installez PyMuPDF ou pypdfium2.")
+elif importlib.util.find_spec("pypdfium2") is not None:
+    PDF_BACKEND = "pypdfium2"
+else:
+    raise ImportError("Aucune bibliothèque PDF disponible. Installez PyMuPDF ou pypdfium2.")
+
+fitz = None
+
+
+def _import_fitz():
+    """Importe PyMuPDF à la demande (coût de chargement de MuPDF évité à l'import du module)"""
+    global fitz
+    if fitz is None:
+        try:
+            import fitz as _fitz
+        except ImportError as e:
+            # Paquet présent mais non chargeable (ex. bibliothèque native manquante)
+            raise ImportError("Aucune bibliothèque PDF disponible. Installez PyMuPDF ou pypdfium2.") from e
+        fitz = _fitz
+    return fitz
+
+# Patterns compilés une seule fois (évite la recompilation/le cache `re` à chaque span)
+
+# Patterns de vraies sections (ignorant sommaire) : 2.3, 2.3.1, 2.4.3.1 (seuls)
+SECTION_PATTERN = re.compile(r'\d+(?:\.\d+){1,3}\s*')  # Ancré via fullmatch()
+SECTION_NUMBER_PATTERN = re.compile(r'^(\d+(?:\.\d+)*)')
+
+# Patterns pour les noms de manuels techniques (ordre = priorité)
+MANUAL_NAME_PATTERNS = [
+    re.compile(r'\b([A-Z]{2,}SG\d+)\b'),      # PROCSG02, etc.
+    re.compile(r'\b([A-Z]{3,}\d+)\b'),        # General format
+    re.compile(r'\b([A-Z]{2,}-[A-Z]{2,})\b'), # Format avec tiret
+    re.compile(r'\b([A-Z]{2,}/[A-Z]{2,})\b'), # Format avec slash
+]
+
+FILENAME_MANUAL_PATTERNS = [
+    re.compile(r'^([A-Z]+\d+)'),  # PROCSG02
+    re.compile(r'^([A-Z]{2,})'),  # OMA, STC
+]
+
+# Faux positifs courants : années, numéros de page, révisions, versions, documents génériques
+MANUAL_NAME_FALSE_POSITIVE = re.compile(r'\d{4}|PAGE\d*|REV\d*|VER\d*|DOC\d*|\d{1,3}')  # Ancré via fullmatch()
+UPPERCASE_LETTER = re.compile(r'[A-Z]')
 
 
 @dataclass
 class SimpleSection:
     """Section détectée - version simplifiée"""
+    __slots__ = ('number', 'title', 'page', 'position_y')  # Pas de __dict__ par instance
+    
     number: str
     title: str
     page: int
@@ -43,6 +88,8 @@ class SimpleSection:
 @dataclass
 class SimpleImage:
     """Image détectée - version simplifiée"""
+    __slots__ = ('page', 'bbox', 'size_bytes', 'width', 'height', 'format', 'hash')
+    
     page: int
     bbox: Tuple[float, float, float, float]  # (x0, y0, x1, y1)
     size_bytes: int
@@ -121,15 +168,12 @@ class LensCRLSimple:
         
         try:
             # 1. Ouvrir le document
-            doc = fitz.open(pdf_path)
+            doc = _import_fitz().open(pdf_path)
             self.logger.info(f"Document ouvert: {len(doc)} pages")
             
-            # 2. Détecter les sections
-            sections = self._detect_sections_simple(doc)
+            # 2-3. Détecter les sections et toutes les images (un seul parcours des pages)
+            sections, all_images = self._scan_document(doc)
             self.logger.info(f"Sections détectées: {len(sections)}")
-            
-            # 3. Détecter toutes les images
-            all_images = self._detect_images_simple(doc)
             self.logger.info(f"Images brutes détectées: {len(all_images)}")
             
             # 4. Filtrer les images (logos, headers, doublons)
@@ -141,7 +185,7 @@ class LensCRLSimple:
             
             # 6. Déduire nom du manuel
             if not manual_name:
-                manual_name = self._deduce_manual_name(pdf_path)
+                manual_name = self._deduce_manual_name(pdf_path, doc)
             
             # 7. Extraire et sauvegarder avec compteur par section
             output_path = Path(output_dir)
@@ -151,15 +195,13 @@ class LensCRLSimple:
             errors = []
             
             # Grouper images par section pour compteur séquentiel
-            images_by_section = {}
-            for img_info in associated_images:
-                section = img_info['section']
-                if section not in images_by_section:
-                    images_by_section[section] = []
-                images_by_section[section].append(img_info)
+            # (tri stable par numéro de section : l'ordre des images dans une section est conservé ;
+            #  la chaîne brute départage "2.1"/"2.01" pour que groupby ne scinde pas une section)
+            associated_images.sort(key=lambda info: (tuple(int(part) for part in info['section'].split('.')), info['section']))
             
             # Traiter chaque section avec compteur
-            for section, section_images in images_by_section.items():
+            for section, group in groupby(associated_images, key=itemgetter('section')):
+                section_images = list(group)
                 total_images_in_section = len(section_images)
                 for counter, img_info in enumerate(section_images, 1):  # Commencer à 1
                     try:
@@ -196,9 +238,12 @@ class LensCRLSimple:
             # Fermer le document ici, après toutes les opérations
             doc.close()
             
+            # Index des images gardées (identité) : évite un parcours de la liste par image
+            kept_ids = {id(img) for img in filtered_images}
+            
             return ExtractionResult(
                 images_extracted=extracted_files,
-                images_filtered=[img for img in all_images if img not in filtered_images],
+                images_filtered=[img for img in all_images if id(img) not in kept_ids],
                 sections_detected=sections,
                 stats=stats,
                 success=True,
@@ -216,64 +261,85 @@ class LensCRLSimple:
                 errors=[str(e)]
             )
     
-    def _detect_sections_simple(self, doc: fitz.Document) -> List[SimpleSection]:
-        """Détection simple et fiable des sections (ignore sommaire)"""
+    def _scan_document(self, doc: fitz.Document) -> Tuple[List[SimpleSection], List[SimpleImage]]:
+        """Parcourt le document une seule fois : chaque page n'est chargée qu'une fois
+        pour la détection des sections et des images"""
         sections = []
+        images = []
+        
+        # Une image répétée (logo, header) partage le même xref sur toutes les pages :
+        # on ne l'extrait et ne la hashe qu'une seule fois
+        xref_cache = {}
         
         for page_num in range(len(doc)):
             page = doc[page_num]
             
             # Ignorer les premières pages (sommaire/table des matières)
-            if page_num < 4:  # Pages 1-4 = couverture, blanc, sommaire, blanc
-                continue
-            
-            blocks = page.get_text("dict")["blocks"]
+            if page_num >= 4:  # Pages 1-4 = couverture, blanc, sommaire, blanc
+                sections.extend(self._detect_page_sections(page, page_num))
             
-            for block in blocks:
-                if "lines" not in block:
-                    continue
+            images.extend(self._detect_page_images(doc, page, page_num, xref_cache))
+        
+        return self._deduplicate_sections(sections), images
+    
+    def _detect_page_sections(self, page: fitz.Page, page_num: int) -> List[SimpleSection]:
+        """Détection simple et fiable des sections d'une page"""
+        sections = []
+        
+        blocks = self._get_text_blocks(page)
+        
+        for block in blocks:
+            if "lines" not in block:
+                continue
+                
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    # Pattern de section : format X.Y.Z en gras, taille >= 11pt
+                    # (tests du moins coûteux au plus coûteux : le nom de police
+                    # n'est mis en minuscules que pour les vrais candidats)
+                    if span["size"] < 11.0:
+                        continue
                     
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        font_size = span["size"]
-                        is_bold = "bold" in span["font"].lower()
+                    text = span["text"].strip()
+                    if (self._is_real_section_pattern(text) and
+                        "bold" in span["font"].lower()):
                         
-                        # Pattern de section : format X.Y.Z en gras, taille >= 11pt
-                        if (is_bold and font_size >= 11.0 and 
-                            self._is_real_section_pattern(text)):
+                        # Extraire le numéro de section
+                        section_number = self._extract_section_number(text)
+                        if section_number:
+                            # Position Y du texte
+                            position_y = span["bbox"][1]
                             
-                            # Extraire le numéro de section
-                            section_number = self._extract_section_number(text)
-                            if section_number:
-                                # Position Y du texte
-                                bbox = span["bbox"]
-                                position_y = bbox[1]
-                                
-                                # Chercher le titre sur la ligne suivante ou même ligne
-                                title = self._find_section_title(text, line, block)
-                                
-                                section = SimpleSection(
-                                    number=section_number,
-                                    title=title,
-                                    page=page_num,
-                                    position_y=position_y
-                                )
-                                sections.append(section)
-                                
-                                self.logger.debug(f"Section trouvée: {section_number} '{title}' page {page_num + 1}")
+                            # Chercher le titre sur la ligne suivante ou même ligne
+                            title = self._find_section_title(text, line, block)
+                            
+                            section = SimpleSection(
+                                number=section_number,
+                                title=title,
+                                page=page_num,
+                                position_y=position_y
+                            )
+                            sections.append(section)
+                            
+                            self.logger.debug("Section trouvée: %s '%s' page %d", section_number, title, page_num + 1)
         
+        return sections
+    
+    def _deduplicate_sections(self, sections: List[SimpleSection]) -> List[SimpleSection]:
+        """Trie les sections (page, position Y) et filtre les doublons proches"""
         # Trier par page puis position Y
         sections.sort(key=lambda s: (s.page, s.position_y))
         
         # Filtrer les doublons proches
+        # Liste triée : seuls les derniers éléments gardés (même page, < 10pt) peuvent être des doublons
         filtered_sections = []
         for section in sections:
             duplicate = False
-            for existing in filtered_sections:
-                if (existing.page == section.page and 
-                    abs(existing.position_y - section.position_y) < 10.0 and
-                    existing.number == section.number):
+            for existing in reversed(filtered_sections):
+                if (existing.page != section.page or
+                    section.position_y - existing.position_y >= 10.0):
+                    break
+                if existing.number == section.number:
                     duplicate = True
                     break
             
@@ -282,28 +348,30 @@ class LensCRLSimple:
         
         return filtered_sections
     
+    def _get_text_blocks(self, page: fitz.Page) -> List[Dict]:
+        """Blocs texte d'une page (format dict), sans le contenu binaire des images"""
+        # get_text("dict") inclut par défaut les images décodées dans les blocs ;
+        # seuls les blocs texte nous intéressent. Les ligatures sont décomposées
+        # (pas de caractères spéciaux à conserver pour des numéros de section)
+        fitz = _import_fitz()
+        flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES & ~fitz.TEXT_PRESERVE_LIGATURES
+        textpage = page.get_textpage(flags=flags)
+        return textpage.extractDICT()["blocks"]
+    
     def _is_real_section_pattern(self, text: str) -> bool:
         """Vérifie si le texte correspond à un pattern de vraie section (pas sommaire)"""
-        import re
-        
-        # Patterns de vraies sections (ignorant sommaire)
-        real_patterns = [
-            r'^\d+\.\d+\.\d+\s*$',      # 2.3.1, 2.4.3, etc. (seuls)
-            r'^\d+\.\d+\.\d+\.\d+\s*$', # 2.4.3.1, etc. (seuls)
-            r'^\d+\.\d+\s*$',           # 2.3, 2.4, etc. (seuls)
-        ]
-        
-        for pattern in real_patterns:
-            if re.match(pattern, text):
-                return True
-        return False
+        # Pré-filtre rapide : la grande majorité des spans ne commence pas par un chiffre
+        if not text or not text[0].isdigit():
+            return False
+        if not 1 <= text.count('.') <= 3:
+            return False
+        
+        return SECTION_PATTERN.fullmatch(text) is not None
     
     def _extract_section_number(self, text: str) -> str:
         """Extrait le numéro de section du texte"""
-        import re
-        
         # Extraire le pattern numérique au début
-        match = re.match(r'^(\d+(?:\.\d+)*)', text.strip())
+        match = SECTION_NUMBER_PATTERN.match(text.strip())
         if match:
             return match.group(1)
         return ""
@@ -315,45 +383,49 @@ class LensCRLSimple:
         section_num = self._extract_section_number(section_text)
         return f"Section {section_num}"
     
-    def _detect_images_simple(self, doc: fitz.Document) -> List[SimpleImage]:
-        """Détection simple et fiable des images"""
+    def _detect_page_images(self, doc: fitz.Document, page: fitz.Page, page_num: int,
+                            xref_cache: Dict[int, Tuple[int, str, str]]) -> List[SimpleImage]:
+        """Détection simple et fiable des images d'une page
+        
+        `xref_cache` (xref → taille, format, hash) est partagé entre les pages du document.
+        """
         images = []
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            image_list = page.get_images()
-            
-            for img in image_list:
-                try:
-                    xref = img[0]
+        for img in page.get_images():
+            try:
+                xref = img[0]
+                if xref not in xref_cache:
                     image_data = doc.extract_image(xref)
-                    
-                    # Obtenir bbox de l'image sur la page
-                    image_rects = page.get_image_rects(xref)
-                    if not image_rects:
-                        continue
-                    
-                    bbox = image_rects[0]
-                    width = int(bbox.width)
-                    height = int(bbox.height)
-                    
-                    # Hash pour détecter doublons
-                    image_hash = hashlib.md5(image_data["image"]).hexdigest()
-                    
-                    simple_image = SimpleImage(
-                        page=page_num,
-                        bbox=(bbox.x0, bbox.y0, bbox.x1, bbox.y1),
-                        size_bytes=len(image_data["image"]),
-                        width=width,
-                        height=height,
-                        format=image_data["ext"],
-                        hash=image_hash
+                    xref_cache[xref] = (
+                        len(image_data["image"]),
+                        image_data["ext"],
+                        hashlib.md5(image_data["image"]).hexdigest()
                     )
-                    images.append(simple_image)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Erreur extraction image page {page_num + 1}: {e}")
+                size_bytes, image_format, image_hash = xref_cache[xref]
+                
+                # Obtenir bbox de l'image sur la page
+                image_rects = page.get_image_rects(xref)
+                if not image_rects:
                     continue
+                
+                bbox = image_rects[0]
+                width = int(bbox.width)
+                height = int(bbox.height)
+                
+                simple_image = SimpleImage(
+                    page=page_num,
+                    bbox=(bbox.x0, bbox.y0, bbox.x1, bbox.y1),
+                    size_bytes=size_bytes,
+                    width=width,
+                    height=height,
+                    format=image_format,
+                    hash=image_hash
+                )
+                images.append(simple_image)
+                
+            except Exception as e:
+                self.logger.warning(f"Erreur extraction image page {page_num + 1}: {e}")
+                continue
         
         return images
     
@@ -361,34 +433,41 @@ class LensCRLSimple:
         """Filtrage simple mais efficace"""
         filtered = []
         seen_hashes = set()
+        page_limits = {}  # Limites header/footer par page : évite de recharger la page pour chaque image
         
+        # Messages de rejet en arguments différés : formatés seulement si DEBUG est actif
         for img in images:
             # 1. Filtrer doublons par hash
             if img.hash in seen_hashes:
-                self.logger.debug(f"Doublon ignoré: hash {img.hash[:8]}")
+                self.logger.debug("Doublon ignoré: hash %.8s", img.hash)
                 continue
             seen_hashes.add(img.hash)
             
             # 2. Filtrer par taille minimale
             if img.width < 50 or img.height < 50:
-                self.logger.debug(f"Image trop petite ignorée: {img.width}x{img.height}")
+                self.logger.debug("Image trop petite ignorée: %dx%d", img.width, img.height)
                 continue
             
             # 3. Filtrer les très petites en bytes (icônes)
             if img.size_bytes < 1000:  # < 1KB
-                self.logger.debug(f"Image trop légère ignorée: {img.size_bytes} bytes")
+                self.logger.debug("Image trop légère ignorée: %d bytes", img.size_bytes)
                 continue
             
             # 4. Filtrer headers/footers par position
-            page_height = doc[img.page].rect.height
-            y_ratio = img.bbox[1] / page_height  # Position Y relative
-            
-            if y_ratio < 0.1:  # 10% du haut (header)
-                self.logger.debug(f"Header ignoré: position Y {y_ratio:.2%}")
+            # (seuils absolus calculés une fois par page : pas de division par image)
+            limits = page_limits.get(img.page)
+            if limits is None:
+                page_height = doc[img.page].rect.height
+                limits = page_limits[img.page] = (page_height, page_height * 0.1, page_height * 0.9)
+            page_height, header_limit, footer_limit = limits
+            y0 = img.bbox[1]
+            
+            if y0 < header_limit:  # 10% du haut (header)
+                self.logger.debug("Header ignoré: position Y %.2f%%", y0 / page_height * 100)
                 continue
                 
-            if y_ratio > 0.9:  # 10% du bas (footer)
-                self.logger.debug(f"Footer ignoré: position Y {y_ratio:.2%}")
+            if y0 > footer_limit:  # 10% du bas (footer)
+                self.logger.debug("Footer ignoré: position Y %.2f%%", y0 / page_height * 100)
                 continue
             
             # 5. Image garde
@@ -400,9 +479,13 @@ class LensCRLSimple:
         """Association simple et robuste image→section"""
         associated = []
         
+        # Clés (page, position Y) triées une seule fois pour la recherche dichotomique
+        sections = sorted(sections, key=lambda s: (s.page, s.position_y))
+        section_keys = [(s.page, s.position_y) for s in sections]
+        
         for img in images:
             # Trouver la dernière section précédente
-            section = self._find_section_for_image(img, sections)
+            section = self._find_section_for_image(img, sections, section_keys)
             
             img_info = {
                 'image': img,
@@ -413,68 +496,79 @@ class LensCRLSimple:
             }
             associated.append(img_info)
             
-            self.logger.debug(f"Image page {img.page + 1} → Section {img_info['section']}")
+            self.logger.debug("Image page %d → Section %s", img.page + 1, img_info['section'])
         
         return associated
     
-    def _find_section_for_image(self, image: SimpleImage, sections: List[SimpleSection]) -> Optional[SimpleSection]:
-        """Trouve la section pour une image : dernière section précédente"""
-        
-        # 1. Sections sur la même page, avant l'image (position Y)
-        same_page_sections = [s for s in sections 
-                            if s.page == image.page and s.position_y < image.bbox[1]]
-        if same_page_sections:
-            # Prendre la dernière section qui est avant l'image sur la même page
-            return max(same_page_sections, key=lambda s: s.position_y)
-        
-        # 2. Si aucune section sur la même page avant l'image,
-        # chercher la dernière section des pages précédentes
-        previous_pages = [s for s in sections if s.page < image.page]
-        if previous_pages:
-            return max(previous_pages, key=lambda s: (s.page, s.position_y))
-        
-        # 3. Fallback : première section du document
+    def _find_section_for_image(self, image: SimpleImage, sections: List[SimpleSection],
+                                section_keys: Optional[List[Tuple[int, float]]] = None) -> Optional[SimpleSection]:
+        """Trouve la section pour une image : dernière section précédente
+        
+        `sections` doit être trié par (page, position Y) ; `section_keys` contient ces clés
+        (calculées ici si absentes).
+        """
+        if not sections:
+            return None
+        
+        if section_keys is None:
+            section_keys = [(s.page, s.position_y) for s in sections]
+        
+        # Dernière section strictement avant l'image : même page au-dessus de l'image,
+        # sinon dernière section des pages précédentes
+        index = bisect_left(section_keys, (image.page, image.bbox[1])) - 1
+        if index >= 0:
+            # À clé égale, garder la première section (comme max())
+            while index > 0 and section_keys[index - 1] == section_keys[index]:
+                index -= 1
+            return sections[index]
+        
+        # Fallback : première section du document
         # Si aucune section trouvée avant l'image
-        return sections[0] if sections else None
+        return sections[0]
     
-    def _deduce_manual_name(self, pdf_path: str) -> str:
-        """Déduit le nom du manuel depuis le footer, métadonnées puis nom de fichier"""
+    def _deduce_manual_name(self, pdf_path: str, doc: Optional[fitz.Document] = None) -> str:
+        """Déduit le nom du manuel depuis le footer, métadonnées puis nom de fichier
         
-        # Tentative 1: Chercher dans les footers (priorité)
-        try:
-            if PDF_BACKEND == "pymupdf":
-                doc = fitz.open(pdf_path)
-                footer_name = self._extract_name_from_footer(doc)
-                doc.close()
-                if footer_name:
-                    self.logger.info(f"Nom trouvé dans footer: {footer_name}")
-                    return footer_name
-        except Exception as e:
-            self.logger.warning(f"Erreur extraction footer: {e}")
+        Si `doc` est fourni (document déjà ouvert), il est réutilisé au lieu de rouvrir le PDF.
+        """
+        
+        # Un seul document ouvert pour footer + métadonnées
+        owns_doc = False
+        if doc is None and PDF_BACKEND == "pymupdf":
+            try:
+                doc = _import_fitz().open(pdf_path)
+                owns_doc = True
+            except Exception as e:
+                self.logger.warning(f"Erreur ouverture PDF: {e}")
         
-        # Tentative 2: Chercher dans les métadonnées PDF
         try:
-            if PDF_BACKEND == "pymupdf":
-                doc = fitz.open(pdf_path)
-                metadata_name = self._extract_name_from_metadata(doc)
+            if doc is not None:
+                # Tentative 1: Chercher dans les footers (priorité)
+                try:
+                    footer_name = self._extract_name_from_footer(doc)
+                    if footer_name:
+                        self.logger.info(f"Nom trouvé dans footer: {footer_name}")
+                        return footer_name
+                except Exception as e:
+                    self.logger.warning(f"Erreur extraction footer: {e}")
+                
+                # Tentative 2: Chercher dans les métadonnées PDF
+                try:
+                    metadata_name = self._extract_name_from_metadata(doc)
+                    if metadata_name:
+                        self.logger.info(f"Nom trouvé dans métadonnées: {metadata_name}")
+                        return metadata_name
+                except Exception as e:
+                    self.logger.warning(f"Erreur extraction métadonnées: {e}")
+        finally:
+            if owns_doc:
                 doc.close()
-                if metadata_name:
-                    self.logger.info(f"Nom trouvé dans métadonnées: {metadata_name}")
-                    return metadata_name
-        except Exception as e:
-            self.logger.warning(f"Erreur extraction métadonnées: {e}")
         
         # Tentative 3: Fallback - Nom de fichier (méthode actuelle)
         filename = Path(pdf_path).stem
-        import re
         
-        patterns = [
-            r'^([A-Z]+\d+)',  # PROCSG02
-            r'^([A-Z]{2,})',  # OMA, STC
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, filename)
+        for pattern in FILENAME_MANUAL_PATTERNS:
+            match = pattern.match(filename)
             if match:
                 filename_name = match.group(1)
                 self.logger.info(f"Nom déduit du fichier: {filename_name}")
@@ -487,8 +581,6 @@ class LensCRLSimple:
     
     def _extract_name_from_footer(self, doc: fitz.Document) -> Optional[str]:
         """Extrait le nom du manuel depuis les footers des pages"""
-        import re
-        
         # Analyser les 3 premières pages pour détecter les patterns de footer
         for page_num in range(min(3, len(doc))):
             page = doc[page_num]
@@ -497,59 +589,42 @@ class LensCRLSimple:
             # Zone footer : 10% du bas de la page
             footer_y_start = page_height * 0.9
             
-            blocks = page.get_text("dict")["blocks"]
-            
-            for block in blocks:
-                if "lines" not in block:
+            # Format "blocks" : tuples (x0, y0, x1, y1, texte, n° bloc, type) - pas de spans/polices à construire
+            # (sans clip : les bboxes doivent rester celles des blocs complets pour le test ci-dessous)
+            for x0, block_y, x1, y1, block_text, block_no, block_type in page.get_text("blocks"):
+                if block_type != 0:  # 0 = texte, 1 = image
                     continue
                 
                 # Vérifier si le block est dans la zone footer
-                block_y = block["bbox"][1]
                 if block_y < footer_y_start:
                     continue
                 
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        
-                        # Patterns pour les noms de manuels techniques
-                        patterns = [
-                            r'\b([A-Z]{2,}SG\d+)\b',      # PROCSG02, etc.
-                            r'\b([A-Z]{3,}\d+)\b',        # General format
-                            r'\b([A-Z]{2,}-[A-Z]{2,})\b', # Format avec tiret
-                            r'\b([A-Z]{2,}/[A-Z]{2,})\b', # Format avec slash
-                        ]
-                        
-                        for pattern in patterns:
-                            match = re.search(pattern, text)
-                            if match:
-                                manual_name = match.group(1)
-                                self.logger.debug(f"Nom candidat trouvé dans footer page {page_num + 1}: {manual_name}")
-                                
-                                # Valider que ce n'est pas un faux positif (dates, numéros de page, etc.)
-                                if self._validate_manual_name(manual_name):
-                                    return manual_name
+                for line in block_text.splitlines():
+                    text = line.strip()
+                    
+                    for pattern in MANUAL_NAME_PATTERNS:
+                        match = pattern.search(text)
+                        if match:
+                            manual_name = match.group(1)
+                            self.logger.debug("Nom candidat trouvé dans footer page %d: %s", page_num + 1, manual_name)
+                            
+                            # Valider que ce n'est pas un faux positif (dates, numéros de page, etc.)
+                            if self._validate_manual_name(manual_name):
+                                return manual_name
         
         return None
     
     def _extract_name_from_metadata(self, doc: fitz.Document) -> Optional[str]:
         """Extrait le nom du manuel depuis les métadonnées PDF"""
-        import re
-        
         try:
             metadata = doc.metadata
             
             # Chercher dans le titre
             if metadata.get('title'):
                 title = metadata['title'].strip()
-                patterns = [
-                    r'\b([A-Z]{2,}SG\d+)\b',
-                    r'\b([A-Z]{3,}\d+)\b',
-                    r'\b([A-Z]{2,}-[A-Z]{2,})\b',
-                ]
                 
-                for pattern in patterns:
-                    match = re.search(pattern, title)
+                for pattern in MANUAL_NAME_PATTERNS[:3]:
+                    match = pattern.search(title)
                     if match:
                         manual_name = match.group(1)
                         if self._validate_manual_name(manual_name):
@@ -558,13 +633,9 @@ class LensCRLSimple:
             # Chercher dans le sujet
             if metadata.get('subject'):
                 subject = metadata['subject'].strip()
-                patterns = [
-                    r'\b([A-Z]{2,}SG\d+)\b',
-                    r'\b([A-Z]{3,}\d+)\b',
-                ]
                 
-                for pattern in patterns:
-                    match = re.search(pattern, subject)
+                for pattern in MANUAL_NAME_PATTERNS[:2]:
+                    match = pattern.search(subject)
                     if match:
                         manual_name = match.group(1)
                         if self._validate_manual_name(manual_name):
@@ -577,28 +648,16 @@ class LensCRLSimple:
     
     def _validate_manual_name(self, name: str) -> bool:
         """Valide qu'un nom candidat est vraiment un nom de manuel"""
-        import re
-        
         # Filtrer les faux positifs courants
-        false_positives = [
-            r'^\d{4}$',           # Années (2024, etc.)
-            r'^PAGE\d*$',         # Numéros de page
-            r'^REV\d*$',          # Révisions
-            r'^VER\d*$',          # Versions
-            r'^DOC\d*$',          # Documents génériques
-            r'^\d{1,3}$',         # Numéros simples
-        ]
-        
-        for fp_pattern in false_positives:
-            if re.match(fp_pattern, name):
-                return False
+        if MANUAL_NAME_FALSE_POSITIVE.fullmatch(name):
+            return False
         
         # Critères de validation positifs
         if len(name) < 3 or len(name) > 15:
             return False
         
         # Doit contenir au moins une lettre et éventuellement des chiffres
-        if not re.search(r'[A-Z]', name):
+        if not UPPERCASE_LETTER.search(name):
             return False
         
         return True
@@ -608,6 +667,7 @@ class LensCRLSimple:
                           prefix: str = "CRL", total_images_in_section: int = 1) -> Optional[Dict]:
         """Sauvegarde simple d'une image avec nomenclature personnalisée"""
         try:
+            fitz = _import_fitz()
             img = img_info['image']
             page = doc[img.page]
             
@@ -625,20 +685,21 @@ class LensCRLSimple:
                 filename = f"{prefix}-{manual_name}-{section}.{img.format}"
             output_file = output_path / filename
             
-            # Sauvegarder
+            # Encoder en mémoire puis écrire : la taille est connue sans stat() supplémentaire
             if img.format.lower() in ['jpg', 'jpeg']:
-                pix.save(str(output_file), output="jpeg")
+                data = pix.tobytes(output="jpeg", jpg_quality=85)
             else:
-                pix.save(str(output_file), output="png")
+                data = pix.tobytes(output="png")
+            output_file.write_bytes(data)
             
-            self.logger.debug(f"Image sauvée: {filename}")
+            self.logger.debug("Image sauvée: %s", filename)
             
             return {
                 'filename': filename,
                 'path': str(output_file),
                 'section': section,
                 'page': img.page + 1,
-                'size_bytes': output_file.stat().st_size,
+                'size_bytes': len(data),
                 'dimensions': f"{pix.width}x{pix.height}",
                 'counter': counter
             }